@@ -655,16 +655,9 @@ class TextifierApp(tk.Tk):
         
         self.queue_status(f"Starting ADVANCED transcription with options: {kwargs}")
         
-        # Check if we need to reload model with different device/precision
-        model_name = self.var_model.get()
-        
-        # Force reload if anything changed
-        if (self.core.whisper_model_name != model_name or 
-            getattr(self.core.transcriber, '_last_device', None) != device or
-            getattr(self.core.transcriber, '_last_compute_type', None) != compute_type):
-            
-             self.queue_status(f"Reloading model {model_name} on {device}...")
-             self.core.whisper_model = None # Force reload
+        # The model is loaded with this device/precision on the worker thread;
+        # Transcriber.load_model reuses the current one if nothing changed
+        self.core.whisper_model_name = self.var_model.get()
         
         output_dir = self.get_output_dir()
         
@@ -682,7 +675,16 @@ class TextifierApp(tk.Tk):
         
         kwargs['output_formats'] = adv_formats
         
-        threading.Thread(target=self._run_transcribe, args=(input_path, output_dir), kwargs=kwargs, daemon=True).start()
+        threading.Thread(target=self._run_advanced_transcribe, args=(input_path, output_dir, device, compute_type),
+                         kwargs=kwargs, daemon=True).start()
+
+    def _run_advanced_transcribe(self, input_path, output_dir, device, compute_type, **kwargs):
+        try:
+            self.core.load_whisper_model(device=device, compute_type=compute_type)
+        except Exception as e:
+            self.queue_status(f"Error loading model: {e}")
+            return
+        self._run_transcribe(input_path, output_dir, **kwargs)
 
     # ================= EDITOR TAB =================
     def setup_editor_tab(self):
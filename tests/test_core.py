@@ -1,7 +1,8 @@
 import pytest
 import os
+from pathlib import Path
 from unittest.mock import patch, MagicMock
-from textifier_core import FormatHandler, Summarizer, SubtitleSegment
+from textifier_core import FormatHandler, Summarizer, SubtitleSegment, TranscriptWriter
 
 def test_format_handler_parsers(sample_vtt_content, sample_srt_content, tmp_path):
     # Test VTT parsing
@@ -70,6 +71,18 @@ def test_model_manager_availability(core_instance, tmp_models_dir):
     assert core_instance.model_manager.is_whisper_model_available(model_name) is True
     assert core_instance.model_manager.is_whisper_model_available("large-v3") is False
 
+def test_get_model_size_tracks_changes_below_top_directory(core_instance, tmp_models_dir):
+    """Sizes must follow files growing in subdirectories (e.g. during a download)."""
+    model_dir = tmp_models_dir / "whisper" / "tiny"
+    (model_dir / "blobs").mkdir(parents=True)
+    weights = model_dir / "blobs" / "model.bin"
+    weights.write_bytes(b"\0" * (1024 * 1024))
+    manager = core_instance.model_manager
+    assert manager.get_model_size(model_dir) == 1.0
+
+    weights.write_bytes(b"\0" * (5 * 1024 * 1024))
+    assert manager.get_model_size(model_dir) == 5.0
+
 @patch("faster_whisper.WhisperModel")
 def test_transcribe_with_advanced_params(mock_whisper_class, core_instance, tmp_path):
     import json
@@ -124,6 +137,7 @@ def test_transcribe_with_advanced_params(mock_whisper_class, core_instance, tmp_
     assert kwargs["word_timestamps"] is True
     assert kwargs["repetition_penalty"] == 1.2
     assert kwargs["vad_filter"] is True
+    assert kwargs["vad_parameters"] == {"min_silence_duration_ms": 500}
 
 
 # ============== RE-SEGMENTATION TESTS ==============
@@ -222,3 +236,181 @@ def test_resegment_handles_multiple_segments():
     for i in range(len(result) - 1):
         assert result[i].start <= result[i + 1].start
 
+
+
+# ============== TRANSLATION BATCHING TESTS ==============
+
+def test_translate_file_batches_segments(core_instance, tmp_path):
+    """translate_file should send cues to the translator in batches, not one by one."""
+    cues = [{'start': f"00:00:{i:02d}.000", 'end': f"00:00:{i:02d}.500", 'text': "x" * (i % 7) + f"line {i}"} for i in range(20)]
+    vtt_file = tmp_path / "talk.vtt"
+    FormatHandler.save_vtt_from_data(cues, vtt_file)
+
+    batch_sizes = []
+    def fake_translate_batches(batches, **kwargs):
+        for batch in batches:
+            batch_sizes.append(len(batch))
+            yield [t.upper() for t in batch]
+    translator = core_instance.translator
+    translator.model = MagicMock()
+    translator.tokenizer = MagicMock(side_effect=lambda texts, **kwargs: {"length": [len(t) for t in texts]})
+    translator.translate_batches = fake_translate_batches
+    output_path = core_instance.translate_file(str(vtt_file), source_lang="en", target_lang="fr")
+
+    assert batch_sizes == [16, 4]
+    translated = FormatHandler.parse_vtt(output_path)
+    # Batches are length-sorted internally but results come back in cue order
+    assert [c['text'] for c in translated] == ["X" * (i % 7) + f"LINE {i}" for i in range(20)]
+
+
+# ============== TIMESTAMP FORMATTING TESTS ==============
+
+def test_format_times_round_to_nearest_millisecond():
+    assert FormatHandler.format_vtt_time(3661.123) == "01:01:01.123"
+    assert FormatHandler.format_srt_time(3661.123) == "01:01:01,123"
+    # Float noise must not drop a millisecond (0.29 * 1000 == 289.999...)
+    assert FormatHandler.format_srt_time(0.29) == "00:00:00,290"
+    # Rounding carries into the minute field instead of printing "60.000"
+    assert FormatHandler.format_vtt_time(59.9996) == "00:01:00.000"
+
+
+def test_save_vtt_and_srt_round_trip(tmp_path):
+    segments = [
+        SubtitleSegment(0.0, 1.5, " First cue "),
+        SubtitleSegment(1.5, 3.25, "Second cue"),
+    ]
+    vtt_file = tmp_path / "out.vtt"
+    srt_file = tmp_path / "out.srt"
+    FormatHandler.save_vtt(segments, vtt_file)
+    FormatHandler.save_srt(segments, srt_file)
+
+    assert vtt_file.read_text(encoding="utf-8").startswith("WEBVTT\n\n1\n00:00:00.000 --> 00:00:01.500\nFirst cue\n\n")
+    assert FormatHandler.parse_vtt(vtt_file)[1] == {'start': "00:00:01.500", 'end': "00:00:03.250", 'text': "Second cue"}
+    assert FormatHandler.parse_srt(srt_file)[0] == {'start': "00:00:00,000", 'end': "00:00:01,500", 'text': "First cue"}
+
+
+def test_parse_vtt_skips_notes_and_keeps_multiline_text(tmp_path):
+    vtt_file = tmp_path / "notes.vtt"
+    vtt_file.write_text(
+        "WEBVTT\n\nNOTE not a cue\n\n1\n00:00:00.000 --> 00:00:01.000\nLine one\nLine two\n\n"
+        "2\n00:00:01.000 --> 00:00:01.500\nA\n   \nB\n\n"
+        "3\n00:00:01.500 --> 00:00:01.800\n\n"
+        "00:00:01.800 --> 00:00:02.000\nNo index, no trailing blank line",
+        encoding="utf-8",
+    )
+    cues = FormatHandler.parse_vtt(vtt_file)
+    # A whitespace-only line stays part of the cue; cues without text are skipped
+    assert [c['text'] for c in cues] == ["Line one\nLine two", "A\n   \nB", "No index, no trailing blank line"]
+    assert cues[1]['start'] == "00:00:01.000"
+
+    srt_file = tmp_path / "empty.srt"
+    srt_file.write_text("1\n00:00:00,000 --> 00:00:01,000\n\n2\n00:00:01,000 --> 00:00:02,000\nText\n", encoding="utf-8")
+    assert [c['text'] for c in FormatHandler.parse_srt(srt_file)] == ["Text"]
+
+
+def test_load_model_reuses_loaded_model_for_auto_device(core_instance):
+    """device='auto' must not rebuild a model that is already loaded."""
+    transcriber = core_instance.transcriber
+    loaded = MagicMock()
+    transcriber.whisper_model = loaded
+    transcriber.whisper_model_name = "tiny"
+    transcriber._last_device = "cpu"
+    # CTranslate2 resolves the requested "int8" to "int8_float32" on CPU
+    transcriber._last_compute_type = "int8"
+    transcriber._resolved_compute_type = "int8_float32"
+    transcriber.model_manager.download_whisper_model = MagicMock()
+
+    transcriber.load_model("tiny", device="auto")
+    transcriber.load_model("tiny", device="cpu")
+    transcriber.load_model("tiny", device="cpu", compute_type="int8")
+    transcriber.load_model("tiny", device="cpu", compute_type="int8_float32")
+
+    assert transcriber.whisper_model is loaded
+    transcriber.model_manager.download_whisper_model.assert_not_called()
+
+
+def test_transcript_writer_matches_batch_writers(tmp_path):
+    """Streaming output must be byte-identical to the list-based save_* writers."""
+    words = [_make_word(float(i), float(i) + 0.8, f" w{i}") for i in range(8)]
+    segments = [
+        _make_segment(0.0, 8.0, " long segment ", words),
+        _make_segment(9.0, 10.0, "no word data"),
+    ]
+    cues = FormatHandler.resegment_for_subtitles(segments)
+
+    FormatHandler.save_vtt(cues, tmp_path / "batch.vtt")
+    FormatHandler.save_srt(cues, tmp_path / "batch.srt")
+    FormatHandler.save_txt(segments, tmp_path / "batch.txt")
+    FormatHandler.save_csv(cues, tmp_path / "batch.csv")
+    FormatHandler.save_tsv(cues, tmp_path / "batch.tsv")
+
+    with TranscriptWriter.for_base_path(tmp_path / "stream", ['vtt', 'srt', 'txt', 'csv', 'tsv']) as writer:
+        for segment in segments:
+            writer.write(segment)
+
+    assert writer.cue_count == len(cues)
+    assert [Path(p).suffix for p in writer.created_files] == ['.vtt', '.srt', '.txt', '.csv', '.tsv']
+    for ext in ('vtt', 'srt', 'txt', 'csv', 'tsv'):
+        assert (tmp_path / f"stream.{ext}").read_bytes() == (tmp_path / f"batch.{ext}").read_bytes()
+
+
+def test_transcript_writer_discard_removes_partial_files(tmp_path):
+    writer = TranscriptWriter.for_base_path(tmp_path / "partial", ['vtt', 'txt'], word_json=True)
+    writer.write(_make_segment(0.0, 1.0, "hello"))
+    writer.discard()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_transcript_writer_discard_keeps_existing_outputs(tmp_path):
+    """A stopped run must not touch transcripts from an earlier run."""
+    (tmp_path / "talk.vtt").write_text("previous run", encoding="utf-8")
+    with TranscriptWriter.for_base_path(tmp_path / "talk", ['vtt', 'txt']) as writer:
+        writer.write(_make_segment(0.0, 1.0, "hello"))
+        writer.discard()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["talk.vtt"]
+    assert (tmp_path / "talk.vtt").read_text(encoding="utf-8") == "previous run"
+
+
+def test_transcript_writer_failed_open_keeps_existing_outputs(tmp_path):
+    """If one output cannot be opened, no existing file may be deleted."""
+    (tmp_path / "talk.vtt").write_text("previous vtt", encoding="utf-8")
+    (tmp_path / "talk.csv").write_text("previous csv", encoding="utf-8")
+    (tmp_path / "talk.csv.part").mkdir()  # open() of the CSV part fails
+    with pytest.raises(OSError):
+        TranscriptWriter.for_base_path(tmp_path / "talk", ['vtt', 'csv'])
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["talk.csv", "talk.csv.part", "talk.vtt"]
+    assert (tmp_path / "talk.vtt").read_text(encoding="utf-8") == "previous vtt"
+
+
+def test_translate_batches_preserves_batch_order(core_instance):
+    """Pipelined tokenization must not reorder or drop batches."""
+    class FakeEncoding(dict):
+        def to(self, device):
+            return self
+
+    tokenizer = MagicMock()
+    tokenizer.lang_code_to_id = {"fr_XX": 7}
+    tokenizer.side_effect = lambda texts, **kwargs: FakeEncoding(texts=texts, length=[len(t) for t in texts])
+    tokenizer.batch_decode.side_effect = lambda out, **kwargs: [f"{t}!" for t in out]
+    model = MagicMock()
+    model.generate.side_effect = lambda texts, **kwargs: texts
+
+    translator = core_instance.translator
+    translator.tokenizer, translator.model = tokenizer, model
+
+    results = list(translator.translate_batches([["a", "b"], ["c"], ["d", "e"]], target_lang="fr"))
+
+    assert results == [["a!", "b!"], ["c!"], ["d!", "e!"]]
+    assert translator.translate("x", target_lang="fr") == "x!"
+    assert model.generate.call_args.kwargs["forced_bos_token_id"] == 7
+
+
+def test_unsupported_target_language_skips_model_load(core_instance):
+    """Language validation only needs the tokenizer, not the mBART weights."""
+    translator = core_instance.translator
+    translator.tokenizer = MagicMock(lang_code_to_id={"fr_XX": 7})
+    translator.load_model = MagicMock()
+
+    with pytest.raises(ValueError, match="Unsupported target language"):
+        list(translator.translate_batches([["hello"]], target_lang="xx"))
+    translator.load_model.assert_not_called()
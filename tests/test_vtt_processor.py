@@ -0,0 +1,59 @@
+import pytest
+from vtt_processor import VTTProcessor, _split_sentences
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("One. Two! Three? Four", ["One.", "Two!", "Three?", "Four"]),
+    ("Wait... what?  Really.\tYes", ["Wait...", "what?", "Really.", "Yes"]),
+    ("Version 1.5 is out. ", ["Version 1.5 is out.", ""]),
+    ("no terminator here", ["no terminator here"]),
+    ("", [""]),
+])
+def test_split_sentences(text, expected):
+    assert _split_sentences(text) == expected
+
+
+def test_parse_and_tutorial_format(sample_vtt_content, tmp_path):
+    vtt_file = tmp_path / "talk.vtt"
+    vtt_file.write_text(sample_vtt_content.replace("Hello,", "<b>Hello</b>,"), encoding="utf-8")
+    processor = VTTProcessor(vtt_file)
+    processor.parse()
+
+    assert [b['start'] for b in processor.blocks] == ["00:00:00.000", "00:00:05.000"]
+    assert processor.get_plain_text() == "Hello, this is a test segment. Testing the second segment output."
+
+    tutorial = processor.get_tutorial_format(chunk_size=1)
+    assert "[IMAGE PLACEHOLDER - Approx Time: 00:00:05.000]" in tutorial
+    assert tutorial.count("[IMAGE PLACEHOLDER") == 2
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "latin-1"])
+def test_parse_detects_encoding(sample_vtt_content, tmp_path, encoding):
+    vtt_file = tmp_path / "encoded.vtt"
+    vtt_file.write_bytes(sample_vtt_content.replace("Hello", "Héllo").encode(encoding))
+    processor = VTTProcessor(vtt_file)
+    processor.parse()
+
+    # A UTF-8 BOM must not leak into the first cue as "\ufeffWEBVTT"
+    assert processor.blocks[0]['text'] == "Héllo, this is a test segment."
+    assert len(processor.blocks) == 2
+
+
+def test_html_steps_are_numbered_consecutively(tmp_path):
+    vtt_file = tmp_path / "steps.vtt"
+    vtt_file.write_text("WEBVTT\n\n00:00:00.000 --> 00:00:05.000\nOne. Two. Three. Four. Five.\n", encoding="utf-8")
+    processor = VTTProcessor(vtt_file)
+    processor.parse()
+
+    html = processor.get_html_format(chunk_size=2)
+    # The short final chunk gets its own number instead of repeating the previous one
+    assert [line.split("step ")[1] for line in html.splitlines() if "<img" in line] == ["1'>", "2'>", "3'>"]
+
+
+def test_html_escapes_cue_text(tmp_path):
+    vtt_file = tmp_path / "amp.vtt"
+    vtt_file.write_text("WEBVTT\n\n00:00:00.000 --> 00:00:05.000\nR&D costs > revenue.\n", encoding="utf-8")
+    processor = VTTProcessor(vtt_file)
+    processor.parse()
+
+    assert "  <p>R&amp;D costs &gt; revenue.</p>" in processor.get_html_format().splitlines()
@@ -1,12 +1,20 @@
 
 import os
+import io
 import json
 import logging
+import importlib.util
 from pathlib import Path
 import urllib.request
 import sys
 import time
+import shutil
+import functools
+import contextlib
 import subprocess
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import csv
 import requests
@@ -37,6 +45,74 @@ _WHISPER_MODELS = {
     "distil-large-v2": "Systran/faster-distil-whisper-large-v2",
 }
 
+# Comprehensive mBART-50 language code mapping (ISO 639-1 -> mBART code)
+_MBART_LANG_CODES = {
+    "en": "en_XX", "fr": "fr_XX", "es": "es_XX", "de": "de_DE", "it": "it_IT",
+    "pt": "pt_XX", "nl": "nl_XX", "ru": "ru_RU", "pl": "pl_PL", "tr": "tr_TR",
+    "hi": "hi_IN", "gu": "gu_IN", "mr": "mr_IN", "ta": "ta_IN", "te": "te_IN",
+    "bn": "bn_IN", "ml": "ml_IN", "ja": "ja_XX", "ko": "ko_KR", "zh": "zh_CN",
+    "ar": "ar_AR", "he": "he_IL", "fa": "fa_IR", "ur": "ur_PK", "vi": "vi_VN",
+    "th": "th_TH", "id": "id_ID", "ms": "ms_MY", "tl": "tl_XX", "sw": "sw_KE",
+    "af": "af_ZA", "xh": "xh_ZA", "cs": "cs_CZ", "sk": "sk_SK", "hr": "hr_HR",
+    "sr": "sr_RS", "bg": "bg_BG", "mk": "mk_MK", "uk": "uk_UA", "ro": "ro_RO",
+    "hu": "hu_HU", "fi": "fi_FI", "sv": "sv_SE", "no": "no_XX", "da": "da_DK",
+    "et": "et_EE", "lv": "lv_LV", "lt": "lt_LT", "ka": "ka_GE", "az": "az_AZ",
+    "kk": "kk_KZ", "mn": "mn_MN", "ne": "ne_NP", "si": "si_LK", "my": "my_MM",
+    "km": "km_KH", "ps": "ps_AF"
+}
+
+# Separator between start and end time on a VTT/SRT cue line
+_CUE_TIME_SEP = " --> "
+
+# Keeping inherited fds lets POSIX use posix_spawn; on Windows closing them
+# is what allows CreateProcess to skip handle inheritance
+_CLOSE_FDS = os.name == "nt"
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name):
+    """Absolute path of a PATH executable, or the bare name if not found.
+
+    subprocess only takes its posix_spawn fast path (no fork of the Python
+    process) when given a path and close_fds=False (see _CLOSE_FDS).
+    """
+    return shutil.which(name) or name
+
+def _default_cpu_threads():
+    """Physical core estimate (logical CPUs / 2 for SMT), at least one.
+
+    CTranslate2 and torch each default to every logical core; running both,
+    plus ffmpeg, on that many threads oversubscribes the CPU.
+    """
+    return max(1, (os.cpu_count() or 2) // 2)
+
+# Inputs that can go straight to Whisper without extracting an .mp3 first
+_AUDIO_ONLY_EXTS = frozenset({'.mp3', '.wav', '.m4a', '.aac', '.flac', '.ogg'})
+
+# int16 PCM -> float32 in [-1, 1); a float32 scalar keeps the multiply in float32
+_PCM16_SCALE = np.float32(1 / 32768.0)
+
+# Segments Whisper may decode ahead of the consumer, and the minimum gap
+# between live-transcript status callbacks (seconds)
+_SEGMENT_QUEUE_SIZE = 64
+_STATUS_INTERVAL = 0.1
+_END_OF_SEGMENTS = object()
+
+# Output file buffer for streamed transcripts (bytes)
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Number of cues/lines sent to mBART per generate() call
+_TRANSLATION_BATCH_SIZE = 16
+
+# Greedy decoding by default: beam search costs ~num_beams x the decoder work
+# for little gain on short subtitle-style lines
+_TRANSLATION_NUM_BEAMS = 1
+
+# Parallel range-request downloads when the optional hf_transfer package is present.
+# huggingface_hub reads this flag at import time and errors if the package is
+# missing, so only opt in when it is actually importable.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 # Configure logger
 logging.basicConfig(
     filename=str(Path(__file__).parent / 'textifier.log'),
@@ -57,7 +133,7 @@ class ModelManager:
         self.whisper_dir = self.models_dir / "whisper"
         self.translation_dir = self.models_dir / "translation"
         self.status_callback = status_callback
-        
+
         self.models_dir.mkdir(parents=True, exist_ok=True)
         self.whisper_dir.mkdir(parents=True, exist_ok=True)
         self.translation_dir.mkdir(parents=True, exist_ok=True)
@@ -81,11 +157,25 @@ class ModelManager:
             return 0
         if path.is_file():
             return path.stat().st_size / (1024 * 1024)
+        return self._dir_size(path) / (1024 * 1024)
+
+    @staticmethod
+    def _dir_size(path):
+        """Sum file sizes under path in bytes, reusing scandir's cached dirent info."""
         total_size = 0
-        for f in path.glob('**/*'):
-            if f.is_file():
-                total_size += f.stat().st_size
-        return total_size / (1024 * 1024)
+        stack = [str(path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            total_size += entry.stat().st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except FileNotFoundError:
+                # Removed mid-walk (e.g. a model being deleted)
+                continue
+        return total_size
 
     def download_whisper_model(self, model_name):
         """Download a faster-whisper model using huggingface_hub."""
@@ -98,17 +188,19 @@ class ModelManager:
         self._update_status(f"Downloading model '{model_name}' from {repo_id}...")
         
         try:
-            from huggingface_hub import snapshot_download
-            snapshot_download(
-                repo_id=repo_id,
-                local_dir=str(dest),
-                local_dir_use_symlinks=False
-            )
+            self._snapshot_download(repo_id, dest)
             self._update_status(f"Model '{model_name}' downloaded successfully.")
         except Exception as e:
             self._update_status(f"Error downloading model: {e}")
             raise e
 
+    def _snapshot_download(self, repo_id, dest):
+        """Download a HF repo snapshot into dest as real files."""
+        from huggingface_hub import snapshot_download
+        # Plain copies, not symlinks into ~/.cache/huggingface (the pre-0.23
+        # default), so deleting a model really frees the disk space
+        snapshot_download(repo_id=repo_id, local_dir=str(dest), local_dir_use_symlinks=False)
+
     def delete_whisper_model(self, model_name):
         """Delete a local Whisper model."""
         dest = self.get_whisper_model_path(model_name)
@@ -130,9 +222,8 @@ class ModelManager:
         """Download mBART model."""
         self._update_status("Downloading translation model (mBART-large-50)...")
         try:
-            from huggingface_hub import snapshot_download
             model_id = "facebook/mbart-large-50-many-to-many-mmt"
-            snapshot_download(repo_id=model_id, local_dir=str(self.translation_dir), local_dir_use_symlinks=False)
+            self._snapshot_download(model_id, self.translation_dir)
             self._update_status("Translation model downloaded successfully.")
         except Exception as e:
             self._update_status(f"Error downloading translation model: {e}")
@@ -140,21 +231,44 @@ class ModelManager:
 
 class Transcriber:
     """Handles audio extraction and Whisper transcription."""
-    def __init__(self, model_manager, status_callback=None):
+    def __init__(self, model_manager, status_callback=None, cpu_threads=0):
         self.model_manager = model_manager
         self.status_callback = status_callback
+        self.cpu_threads = cpu_threads  # 0 = CTranslate2 default
         self.whisper_model = None
         self.whisper_model_name = None
+        self._last_device = None
+        self._last_compute_type = None
+        self._resolved_compute_type = None
         self.stop_requested = False
 
     def _update_status(self, message):
         if self.status_callback:
             self.status_callback(message)
 
+    @staticmethod
+    def _probe_duration(file_path):
+        """Return the media duration in seconds via ffprobe, or None if unknown."""
+        cmd = [
+            _resolve_executable("ffprobe"),
+            "-v", "quiet",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(file_path)
+        ]
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, close_fds=_CLOSE_FDS)
+            return float(result.stdout.strip())
+        except (OSError, ValueError):
+            return None
+
     def load_audio(self, file_path, sr=16000):
-        """Extract audio using ffmpeg pipe to avoid intermediate disk writes."""
+        """Extract audio using ffmpeg pipe to avoid intermediate disk writes.
+
+        Returns mono float32 PCM in [-1, 1), or the file path on ffmpeg failure.
+        """
         cmd = [
-            "ffmpeg",
+            _resolve_executable("ffmpeg"),
             "-v", "quiet",
             "-i", str(file_path),
             "-f", "s16le",
@@ -163,20 +277,51 @@ class Transcriber:
             "-ac", "1",
             "-"
         ]
+        chunk_bytes = 1 << 20
+        duration = self._probe_duration(file_path)
+        # One second of headroom absorbs container duration rounding
+        capacity = int(duration * sr) + sr if duration else 60 * sr
         try:
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            stdout, stderr = process.communicate()
-            if process.returncode != 0:
-                raise RuntimeError(f"FFmpeg failed: {stderr.decode()}")
-            
-            return np.frombuffer(stdout, dtype=np.int16).astype(np.float32) / 32768.0
+            # stderr is discarded (ffmpeg runs with -v quiet): no second pipe to
+            # drain, and no risk of it filling up while we block on stdout
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                       bufsize=chunk_bytes, close_fds=_CLOSE_FDS)
+            out = np.empty(capacity, dtype=np.float32)
+            # Reusable int16 staging buffer: readinto() fills it in place, so no
+            # per-chunk bytes object is allocated
+            staging = np.empty(chunk_bytes // 2, dtype=np.int16)
+            staging_bytes = memoryview(staging).cast('B')
+            pos = 0
+            while True:
+                # Buffered reads fill the whole buffer until EOF, so only the
+                # final chunk can end on a partial sample
+                nbytes = process.stdout.readinto(staging_bytes)
+                if not nbytes:
+                    break
+                chunk = staging[:nbytes // 2]
+                end = pos + len(chunk)
+                if end > len(out):
+                    # Duration was under-reported (or unknown): grow geometrically
+                    out = np.resize(out, max(end, 2 * len(out)))
+                # Cast and scale in one ufunc pass, written straight into place
+                np.multiply(chunk, _PCM16_SCALE, out=out[pos:end], dtype=np.float32, casting='unsafe')
+                pos = end
+            if process.wait() != 0:
+                raise RuntimeError(f"FFmpeg exited with code {process.returncode}")
+
+            return out[:pos]
         except Exception as e:
             self._update_status(f"FFmpeg error: {e}. Falling back to standard loading.")
             return str(file_path) # Fallback to letting faster-whisper handle it
 
     def load_model(self, model_name, device="auto", compute_type="default"):
         if self.whisper_model and self.whisper_model_name == model_name:
-            if device != "auto" and getattr(self, '_last_device', None) == device:
+            # "auto" accepts whatever device the loaded model already resolved to
+            resolved_device = self._last_device if device == "auto" else device
+            # Likewise "default"/"auto" accept the compute type already in use; an
+            # explicit type matches either what was requested or what it resolved to
+            same_type = compute_type in ("default", "auto", self._last_compute_type, self._resolved_compute_type)
+            if resolved_device == self._last_device and same_type:
                 return
         
         if not self.model_manager.is_whisper_model_available(model_name):
@@ -189,126 +334,278 @@ class Transcriber:
         if device == "auto":
             device = "cuda" if torch.cuda.is_available() else "cpu"
         
-        # 2. Compute Type Multi-stage Fallback
+        # 2. Compute Type Selection
+        # "auto" lets CTranslate2 pick the fastest type the device supports in a
+        # single attempt; explicit types are only tried if that attempt fails.
         model_path = str(self.model_manager.get_whisper_model_path(model_name))
-        
-        # Sequence of types to try per device
-        cuda_types = ["float16", "int8_float16", "int8", "float32"]
-        cpu_types = ["int8", "float32"]
-        
+        first_type = compute_type if compute_type != "default" else "auto"
+        attempts = [(device, first_type)]
         if device == "cuda":
-            # If user explicitly requested a type (not "default"), put it first
-            if compute_type != "default" and compute_type in cuda_types:
-                cuda_types.remove(compute_type)
-                cuda_types.insert(0, compute_type)
-            
-            for ctype in cuda_types:
-                try:
-                    self._update_status(f"Trying {model_name} on CUDA ({ctype})...")
-                    self.whisper_model = WhisperModel(model_path, device="cuda", compute_type=ctype)
-                    self._last_compute_type = ctype
-                    self._last_device = "cuda"
-                    break 
-                except Exception as e:
-                    self._update_status(f"CUDA {ctype} failed: {str(e).split('.')[0]}.")
-                    continue
-            
-        # If CUDA failed or was never selected, try CPU
-        if not self.whisper_model:
-            device = "cpu"
-            for ctype in cpu_types:
-                try:
-                    self._update_status(f"Trying {model_name} on CPU ({ctype})...")
-                    self.whisper_model = WhisperModel(model_path, device="cpu", compute_type=ctype)
-                    self._last_compute_type = ctype
-                    self._last_device = "cpu"
-                    break
-                except Exception as e:
-                    self._update_status(f"CPU {ctype} failed: {e}")
-                    continue
+            fallback_types = ["float16"]
+            # int8_float16 needs compute capability 7.0+; older cards only fail on it
+            if torch.cuda.is_available() and torch.cuda.get_device_capability()[0] >= 7:
+                fallback_types.append("int8_float16")
+            fallback_types.append("float32")
+            attempts += [("cuda", ctype) for ctype in fallback_types if ctype != first_type]
+        if ("cpu", "auto") not in attempts:
+            attempts.append(("cpu", "auto"))
+
+        self.whisper_model = None
+        last_error = None
+        for attempt_device, ctype in attempts:
+            try:
+                self._update_status(f"Loading {model_name} on {attempt_device.upper()} ({ctype})...")
+                self.whisper_model = WhisperModel(model_path, device=attempt_device, compute_type=ctype, cpu_threads=self.cpu_threads)
+                self._last_device = attempt_device
+                break
+            except Exception as e:
+                last_error = e
+                self._update_status(f"{attempt_device.upper()} {ctype} failed: {str(e).split('.')[0]}.")
 
         if not self.whisper_model:
-            raise RuntimeError(f"Could not load Whisper model '{model_name}' on any device/compute type.")
+            raise RuntimeError(f"Could not load Whisper model '{model_name}' on any device/compute type: {last_error}") from last_error
 
+        # Callers compare against the type they asked for; the type CTranslate2
+        # resolved it to (e.g. "int8" -> "int8_float32") is only reported
+        self._last_compute_type = ctype
+        self._resolved_compute_type = getattr(getattr(self.whisper_model, 'model', None), 'compute_type', ctype)
         self.whisper_model_name = model_name
-        self._update_status(f"READY: {model_name} on {self._last_device} ({self._last_compute_type}).")
+        self._update_status(f"READY: {model_name} on {self._last_device} ({self._resolved_compute_type}).")
 
     def transcribe(self, input_path, **kwargs):
+        """Start transcribing and return (segments, info).
+
+        segments is a lazy generator: Whisper decodes the next chunk only when
+        the caller asks for it, so output can be written while inference
+        continues. Iteration ends early once stop_requested is set.
+        """
         self.stop_requested = False
         audio = self.load_audio(input_path)
         
         if 'vad_filter' not in kwargs:
             kwargs['vad_filter'] = True
+        if kwargs['vad_filter']:
+            # Cut at half-second pauses so silent stretches are skipped, not decoded
+            kwargs.setdefault('vad_parameters', {'min_silence_duration_ms': 500})
         # Always enable word-level timestamps for accurate subtitle re-segmentation
         kwargs['word_timestamps'] = True
         segments, info = self.whisper_model.transcribe(audio, **kwargs)
         self._update_status(f"Detected language: {info.language} ({info.language_probability:.2f})")
-        
-        result_segments = []
-        for segment in segments:
-            if self.stop_requested:
-                return None
-            result_segments.append(segment)
-            self._update_status(f"[{FormatHandler.format_vtt_time(segment.start)}] {segment.text}")
-        
-        return result_segments, info
+        return self._iter_segments(segments), info
+
+    def _iter_segments(self, segments):
+        """Yield segments while Whisper keeps decoding ahead on a worker thread.
+
+        Status callbacks (GUI log updates) and output writes happen on the
+        consuming thread, so they no longer stall inference. Status lines are
+        coalesced to at most one callback per _STATUS_INTERVAL, and flushed
+        after that long without a new segment.
+        """
+        pending = queue.Queue(maxsize=_SEGMENT_QUEUE_SIZE)
+        done = threading.Event()
+
+        def put(item):
+            # Give up once the consumer has stopped, instead of blocking forever
+            while not done.is_set():
+                try:
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for segment in segments:
+                    if self.stop_requested or not put(segment):
+                        break
+                put(_END_OF_SEGMENTS)
+            except Exception as e:
+                put(e)
+
+        threading.Thread(target=produce, daemon=True).start()
+        lines = []
+        last_status = 0.0
+        try:
+            while True:
+                try:
+                    item = pending.get(timeout=_STATUS_INTERVAL)
+                except queue.Empty:
+                    # Decoding is slow: show what is buffered instead of
+                    # holding it until the next segment arrives
+                    if lines:
+                        self._update_status("\n".join(lines))
+                        lines.clear()
+                        last_status = time.monotonic()
+                    if self.stop_requested:
+                        break
+                    continue
+                if item is _END_OF_SEGMENTS or self.stop_requested:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                lines.append(f"[{FormatHandler.format_vtt_time(item.start)}] {item.text}")
+                now = time.monotonic()
+                if now - last_status >= _STATUS_INTERVAL:
+                    self._update_status("\n".join(lines))
+                    lines.clear()
+                    last_status = now
+                yield item
+        finally:
+            done.set()
+            if lines:
+                self._update_status("\n".join(lines))
 
 class Translator:
     """Handles text translation using mBART."""
-    def __init__(self, model_manager, status_callback=None):
+    def __init__(self, model_manager, status_callback=None, load_in_8bit=False, cpu_threads=None):
         self.model_manager = model_manager
         self.status_callback = status_callback
+        self.cpu_threads = cpu_threads  # None = torch default
         self.model = None
         self.tokenizer = None
+        self._lang_ids = {}  # short code -> mBART language token id
+        # bitsandbytes int8 on CUDA: less VRAM, but often slower than fp16 for
+        # small-batch decoding, so it stays opt-in
+        self.load_in_8bit = load_in_8bit
 
     def _update_status(self, message):
         if self.status_callback:
             self.status_callback(message)
 
-    def load_model(self):
-        if self.model: return
+    def load_tokenizer(self):
+        """Load only the mBART tokenizer (enough for language checks and lengths)."""
+        if self.tokenizer: return
         if not self.model_manager.is_translation_model_available():
             self.model_manager.download_translation_model()
-            
-        from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+
+        from transformers import AutoTokenizer
+        self.tokenizer = AutoTokenizer.from_pretrained(str(self.model_manager.translation_dir))
+        # Resolve every supported language tag once instead of per request
+        lang_code_to_id = self.tokenizer.lang_code_to_id
+        self._lang_ids = {k: lang_code_to_id[v] for k, v in _MBART_LANG_CODES.items() if v in lang_code_to_id}
+
+    def load_model(self):
+        if self.model: return
+        self.load_tokenizer()
+
+        from transformers import AutoModelForSeq2SeqLM
+        import torch
         model_path = str(self.model_manager.translation_dir)
-        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
-        self.model = AutoModelForSeq2SeqLM.from_pretrained(model_path)
-        self._update_status("Translation model loaded.")
 
-    def translate(self, text, source_lang="en", target_lang="fr"):
-        self.load_model()
-        # Comprehensive mBART-50 language code mapping
-        lang_codes = {
-            "en": "en_XX", "fr": "fr_XX", "es": "es_XX", "de": "de_DE", "it": "it_IT",
-            "pt": "pt_XX", "nl": "nl_XX", "ru": "ru_RU", "pl": "pl_PL", "tr": "tr_TR",
-            "hi": "hi_IN", "gu": "gu_IN", "mr": "mr_IN", "ta": "ta_IN", "te": "te_IN",
-            "bn": "bn_IN", "ml": "ml_IN", "ja": "ja_XX", "ko": "ko_KR", "zh": "zh_CN",
-            "ar": "ar_AR", "he": "he_IL", "fa": "fa_IR", "ur": "ur_PK", "vi": "vi_VN",
-            "th": "th_TH", "id": "id_ID", "ms": "ms_MY", "tl": "tl_XX", "sw": "sw_KE",
-            "af": "af_ZA", "xh": "xh_ZA", "cs": "cs_CZ", "sk": "sk_SK", "hr": "hr_HR",
-            "sr": "sr_RS", "bg": "bg_BG", "mk": "mk_MK", "uk": "uk_UA", "ro": "ro_RO",
-            "hu": "hu_HU", "fi": "fi_FI", "sv": "sv_SE", "no": "no_XX", "da": "da_DK",
-            "et": "et_EE", "lv": "lv_LV", "lt": "lt_LT", "ka": "ka_GE", "az": "az_AZ",
-            "kk": "kk_KZ", "mn": "mn_MN", "ne": "ne_NP", "si": "si_LK", "my": "my_MM",
-            "km": "km_KH", "ps": "ps_AF"
-        }
-        
-        # Get mBART codes or use input as-is if already in mBART format
-        src_code = lang_codes.get(source_lang, source_lang)
-        tgt_code = lang_codes.get(target_lang, target_lang)
-        
-        if tgt_code not in self.tokenizer.lang_code_to_id:
+        if self.cpu_threads:
+            torch.set_num_threads(self.cpu_threads)
+
+        # Pick precision at load time instead of running mBART in fp32 everywhere.
+        # Like the Whisper loader, fall back rather than fail: if the fast path
+        # is unsupported (old GPU, missing bitsandbytes, no quantized engine),
+        # load plain fp32 on CPU.
+        try:
+            self.model, precision = self._load_fast_model(model_path, AutoModelForSeq2SeqLM, torch)
+        except Exception as e:
+            self._update_status(f"Optimized translation model load failed: {e}. Falling back to float32 on CPU.")
+            self.model = AutoModelForSeq2SeqLM.from_pretrained(model_path).eval()
+            precision = "float32"
+        self._update_status(f"Translation model loaded ({self.model.device}, {precision}).")
+
+    def _load_fast_model(self, model_path, model_cls, torch):
+        # low_cpu_mem_usage skips the throwaway random init, but needs accelerate
+        low_mem = importlib.util.find_spec("accelerate") is not None
+        if torch.cuda.is_available():
+            if self.load_in_8bit:
+                # Requires the optional bitsandbytes + accelerate packages
+                model = model_cls.from_pretrained(model_path, load_in_8bit=True, device_map="auto")
+                return model.eval(), "int8"
+            model = model_cls.from_pretrained(model_path, torch_dtype=torch.float16, low_cpu_mem_usage=low_mem)
+            return model.to("cuda").eval(), "float16"
+        model = model_cls.from_pretrained(model_path, low_cpu_mem_usage=low_mem)
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return model.eval(), "int8 dynamic"
+
+    def translate(self, text, source_lang="en", target_lang="fr", num_beams=_TRANSLATION_NUM_BEAMS):
+        return self.translate_batch([text], source_lang=source_lang, target_lang=target_lang, num_beams=num_beams)[0]
+
+    def translate_batch(self, texts, source_lang="en", target_lang="fr", batch_size=_TRANSLATION_BATCH_SIZE,
+                        progress_callback=None, num_beams=_TRANSLATION_NUM_BEAMS):
+        """Translate a list of texts, batch_size at a time, preserving order.
+
+        Texts are grouped by token count before batching so each padded batch
+        holds similar-length inputs, then results are put back in input order.
+        progress_callback, if given, is called with (done, total) per batch.
+        """
+        if not texts:
+            return []
+        self.load_tokenizer()
+        # Padding is measured in tokens, so sort on those rather than characters
+        lengths = self.tokenizer(list(texts), truncation=True, max_length=512, return_length=True)["length"]
+        order = sorted(range(len(texts)), key=lengths.__getitem__)
+        batches = ([texts[i] for i in order[k:k + batch_size]] for k in range(0, len(order), batch_size))
+        results = [None] * len(texts)
+        done = 0
+        for translated in self.translate_batches(batches, source_lang=source_lang, target_lang=target_lang,
+                                                 num_beams=num_beams):
+            for text in translated:
+                results[order[done]] = text
+                done += 1
+            if progress_callback:
+                progress_callback(done, len(texts))
+        return results
+
+    def translate_batches(self, batches, source_lang="en", target_lang="fr", num_beams=_TRANSLATION_NUM_BEAMS):
+        """Yield the translations of each batch of texts in turn.
+
+        The next batch is tokenized on a helper thread while generate() runs
+        on the current one (torch releases the GIL inside generate). Decoding
+        waits for that tokenization to finish, since a fast tokenizer must not
+        be used from two threads at once.
+        """
+        # Reject an unsupported language before paying for the weight load
+        self.load_tokenizer()
+        forced_bos_token_id = self._lang_id(target_lang)
+        if forced_bos_token_id is None:
             raise ValueError(f"Unsupported target language: {target_lang}")
-            
-        self.tokenizer.src_lang = src_code
-        inputs = self.tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
-        translated = self.model.generate(
-            **inputs,
-            forced_bos_token_id=self.tokenizer.lang_code_to_id[lang_codes[target_lang]],
-            max_length=512, num_beams=5
-        )
-        return self.tokenizer.batch_decode(translated, skip_special_tokens=True)[0]
+        self.load_model()
+
+        # Get mBART code or use input as-is if already in mBART format
+        self.tokenizer.src_lang = _MBART_LANG_CODES.get(source_lang, source_lang)
+
+        batches = iter(batches)
+        first = next(batches, None)
+        if first is None:
+            return
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            inputs = self._tokenize(first)
+            for batch in batches:
+                pending = pool.submit(self._tokenize, batch)
+                translated = self._generate(inputs, forced_bos_token_id, num_beams)
+                inputs = pending.result()
+                yield self.tokenizer.batch_decode(translated, skip_special_tokens=True)
+            translated = self._generate(inputs, forced_bos_token_id, num_beams)
+            yield self.tokenizer.batch_decode(translated, skip_special_tokens=True)
+
+    def _lang_id(self, lang):
+        """Token id of the mBART language tag for a short or mBART-format code, or None."""
+        token_id = self._lang_ids.get(lang)
+        if token_id is None:
+            token_id = self.tokenizer.lang_code_to_id.get(_MBART_LANG_CODES.get(lang, lang))
+        return token_id
+
+    def _tokenize(self, texts):
+        return self.tokenizer(list(texts), return_tensors="pt", padding=True, truncation=True, max_length=512).to(self.model.device)
+
+    def _generate(self, inputs, forced_bos_token_id, num_beams=_TRANSLATION_NUM_BEAMS):
+        import torch
+        # No autograd bookkeeping during decoding. On CUDA, autocast also runs
+        # any layers left in fp32 (e.g. an int8 model's non-quantized parts)
+        # with fp16 matmuls.
+        on_cuda = self.model.device.type == "cuda"
+        amp = torch.autocast("cuda", dtype=torch.float16) if on_cuda else contextlib.nullcontext()
+        with torch.inference_mode(), amp:
+            return self.model.generate(
+                **inputs,
+                forced_bos_token_id=forced_bos_token_id,
+                max_length=512, num_beams=num_beams
+            )
 
 class SubtitleSegment:
     """Lightweight segment object compatible with FormatHandler save methods."""
@@ -320,63 +617,109 @@ class SubtitleSegment:
 
 class FormatHandler:
     """Handles VTT/SRT parsing and saving."""
+    @staticmethod
+    def _split_ms(seconds):
+        """Round to integer milliseconds once, then split with exact divmods."""
+        h, rem = divmod(int(seconds * 1000 + 0.5), 3_600_000)
+        m, rem = divmod(rem, 60_000)
+        s, ms = divmod(rem, 1000)
+        return h, m, s, ms
+
     @staticmethod
     def format_vtt_time(seconds):
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = seconds % 60
-        return f"{h:02d}:{m:02d}:{s:06.3f}"
+        return "%02d:%02d:%02d.%03d" % FormatHandler._split_ms(seconds)
 
     @staticmethod
     def format_srt_time(seconds):
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = seconds % 60
-        return f"{h:02d}:{m:02d}:{int(s):02d},{int((s % 1) * 1000):03d}"
+        # Same split as VTT, so both formats always agree to the millisecond
+        return "%02d:%02d:%02d,%03d" % FormatHandler._split_ms(seconds)
+
+    @staticmethod
+    def _cue_block(index, start, end, text):
+        """One numbered VTT/SRT cue from already formatted timestamps."""
+        return f"{index}\n{start}{_CUE_TIME_SEP}{end}\n{text}\n\n"
 
     @staticmethod
     def save_vtt(segments, path):
+        # Format everything up front and hand the file a single write
+        fmt = FormatHandler.format_vtt_time
+        block = FormatHandler._cue_block
+        parts = ["WEBVTT\n\n"]
+        parts.extend(
+            block(i, fmt(s.start), fmt(s.end), s.text.strip())
+            for i, s in enumerate(segments, 1)
+        )
         with open(path, "w", encoding="utf-8") as f:
-            f.write("WEBVTT\n\n")
-            for i, s in enumerate(segments):
-                f.write(f"{i+1}\n{FormatHandler.format_vtt_time(s.start)} --> {FormatHandler.format_vtt_time(s.end)}\n{s.text.strip()}\n\n")
+            f.write("".join(parts))
 
     @staticmethod
     def save_srt(segments, path):
+        fmt = FormatHandler.format_srt_time
+        block = FormatHandler._cue_block
+        content = "".join(
+            block(i, fmt(s.start), fmt(s.end), s.text.strip())
+            for i, s in enumerate(segments, 1)
+        )
         with open(path, "w", encoding="utf-8") as f:
-            for i, s in enumerate(segments):
-                f.write(f"{i+1}\n{FormatHandler.format_srt_time(s.start)} --> {FormatHandler.format_srt_time(s.end)}\n{s.text.strip()}\n\n")
+            f.write(content)
     
     @staticmethod
     def save_txt(segments, path):
+        content = "".join(f"{s.text.strip()}\n" for s in segments)
         with open(path, "w", encoding="utf-8") as f:
-            for s in segments:
-                f.write(s.text.strip() + "\n")
+            f.write(content)
     
     @staticmethod
     def save_csv(segments, path):
+        # csv.writer targets an in-memory buffer; the file gets one write
+        fmt = FormatHandler.format_vtt_time
+        buf = io.StringIO(newline="")
+        writer = csv.writer(buf)
+        writer.writerow(["Start", "End", "Text"])
+        writer.writerows((fmt(s.start), fmt(s.end), s.text.strip()) for s in segments)
         with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["Start", "End", "Text"])
-            for s in segments:
-                writer.writerow([
-                    FormatHandler.format_vtt_time(s.start),
-                    FormatHandler.format_vtt_time(s.end),
-                    s.text.strip()
-                ])
+            f.write(buf.getvalue())
 
     @staticmethod
     def save_tsv(segments, path):
         """Save transcription data to TSV (for objects)."""
+        fmt = FormatHandler.format_vtt_time
+        buf = io.StringIO(newline="")
+        writer = csv.writer(buf, delimiter="\t")
+        writer.writerow(["start", "end", "text"])
+        writer.writerows((fmt(s.start), fmt(s.end), s.text.strip()) for s in segments)
         with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f, delimiter="\t")
-            writer.writerow(["start", "end", "text"])
-            for s in segments:
-                writer.writerow([
-                    FormatHandler.format_vtt_time(s.start),
-                    FormatHandler.format_vtt_time(s.end),
-                    s.text.strip()
-                ])
+            f.write(buf.getvalue())
+
+    @staticmethod
+    def _iter_cues(lines):
+        """Yield {'start', 'end', 'text'} for each timed cue in a VTT/SRT line stream.
+
+        Single pass: a line containing " --> " opens a cue, the lines after it
+        are its text, and an empty line closes it (whitespace-only lines are
+        text). Headers, indices and NOTE blocks never contain the separator
+        and are skipped, as are cues without text.
+        """
+        start = end = None
+        text_buf = []
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if start is None:
+                if _CUE_TIME_SEP in line:
+                    start, _, end = line.partition(_CUE_TIME_SEP)
+                    start, end = start.strip(), end.strip()
+            elif line:
+                text_buf.append(line)
+            else:
+                text = '\n'.join(text_buf).strip()
+                if text:
+                    yield {'start': start, 'end': end, 'text': text}
+                start = None
+                text_buf.clear()
+        if start is not None:
+            text = '\n'.join(text_buf).strip()
+            if text:
+                yield {'start': start, 'end': end, 'text': text}
 
     @staticmethod
     def parse_vtt(file_path):
@@ -384,22 +727,7 @@ class FormatHandler:
         cues = []
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            blocks = content.split('\n\n')
-            for block in blocks:
-                lines = block.strip().split('\n')
-                if not lines or lines[0] == "WEBVTT": continue
-                timestamp_line_index = -1
-                for i, line in enumerate(lines):
-                    if " --> " in line:
-                        timestamp_line_index = i
-                        break
-                if timestamp_line_index != -1:
-                    times = lines[timestamp_line_index].split(" --> ")
-                    if len(times) == 2:
-                        start, end = times[0].strip(), times[1].strip()
-                        text = "\n".join(lines[timestamp_line_index+1:])
-                        cues.append({'start': start, 'end': end, 'text': text})
+                cues = list(FormatHandler._iter_cues(f))
         except Exception as e:
             logging.error(f"Error parsing VTT: {e}")
         return cues
@@ -418,21 +746,7 @@ class FormatHandler:
         segments = []
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            blocks = content.strip().split('\n\n')
-            for block in blocks:
-                lines = block.strip().split('\n')
-                if len(lines) >= 3:
-                    # Skip index line, get timestamp and text
-                    timestamp_line = lines[1] if '-->' in lines[1] else (lines[0] if '-->' in lines[0] else None)
-                    if timestamp_line and '-->' in timestamp_line:
-                        times = timestamp_line.split(' --> ')
-                        if len(times) == 2:
-                            start, end = times[0].strip(), times[1].strip()
-                            # Join remaining lines as text
-                            text_start_idx = 2 if '-->' in lines[1] else 1
-                            text = '\n'.join(lines[text_start_idx:])
-                            segments.append({'start': start, 'end': end, 'text': text})
+                segments = list(FormatHandler._iter_cues(f))
         except Exception as e:
             logging.error(f"Error parsing SRT: {e}")
         return segments
@@ -451,13 +765,12 @@ class FormatHandler:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
-                for row in reader:
-                    if 'Start' in row and 'End' in row and 'Text' in row:
-                        segments.append({
-                            'start': row['Start'],
-                            'end': row['End'],
-                            'text': row['Text']
-                        })
+                # DictReader keys every row by the header, so check it once
+                if {'Start', 'End', 'Text'}.issubset(reader.fieldnames or ()):
+                    segments = [
+                        {'start': row['Start'], 'end': row['End'], 'text': row['Text']}
+                        for row in reader
+                    ]
         except Exception as e:
             logging.error(f"Error parsing CSV: {e}")
         return segments
@@ -468,8 +781,7 @@ class FormatHandler:
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(['Start', 'End', 'Text'])
-            for segment in data:
-                writer.writerow([segment['start'], segment['end'], segment['text']])
+            writer.writerows((segment['start'], segment['end'], segment['text']) for segment in data)
 
     @staticmethod
     def save_tsv_from_data(data, output_path):
@@ -477,8 +789,7 @@ class FormatHandler:
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f, delimiter='\t')
             writer.writerow(['start', 'end', 'text'])
-            for segment in data:
-                writer.writerow([segment['start'], segment['end'], segment['text']])
+            writer.writerows((segment['start'], segment['end'], segment['text']) for segment in data)
     
     @staticmethod
     def parse_txt(file_path):
@@ -560,6 +871,139 @@ class FormatHandler:
         
         return subtitle_cues
 
+class TranscriptWriter:
+    """Writes transcript files incrementally as segments arrive.
+
+    Timed formats (VTT, SRT, CSV, TSV) get the short cues produced by
+    FormatHandler.resegment_for_subtitles; TXT and the word-level JSON keep
+    the original Whisper segments. Nothing is accumulated in memory, so
+    memory use does not depend on the transcript length.
+
+    Output goes to "<name>.part" files that only replace the real ones in
+    close(), so a stopped or failed run leaves earlier transcripts intact.
+    """
+    FORMATS = ('vtt', 'srt', 'txt', 'csv', 'tsv')
+
+    def __init__(self, paths):
+        """paths maps a format name (FORMATS or 'json') to its output file."""
+        self.paths = {fmt: Path(path) for fmt, path in paths.items()}
+        self.segment_count = 0
+        self.cue_count = 0
+        self._files = {}
+        self._parts = {}
+        self._csv_writers = {}
+
+        try:
+            for fmt, path in self.paths.items():
+                part = path.with_name(path.name + ".part")
+                newline = "" if fmt in ('csv', 'tsv') else None
+                # A large buffer turns many small per-cue writes into few syscalls
+                self._files[fmt] = open(part, "w", newline=newline, encoding="utf-8", buffering=_WRITE_BUFFER_SIZE)
+                self._parts[fmt] = part
+        except Exception:
+            self.discard()
+            raise
+
+        if 'vtt' in self._files:
+            self._files['vtt'].write("WEBVTT\n\n")
+        if 'csv' in self._files:
+            self._csv_writers['csv'] = csv.writer(self._files['csv'])
+            self._csv_writers['csv'].writerow(["Start", "End", "Text"])
+        if 'tsv' in self._files:
+            self._csv_writers['tsv'] = csv.writer(self._files['tsv'], delimiter="\t")
+            self._csv_writers['tsv'].writerow(["start", "end", "text"])
+        if 'json' in self._files:
+            self._files['json'].write("[")
+
+    @classmethod
+    def for_base_path(cls, base_path, formats, word_json=False):
+        """Writer for "<base_path>.<fmt>" per requested format (and .words.json)."""
+        paths = {fmt: f"{base_path}.{fmt}" for fmt in cls.FORMATS if fmt in formats}
+        if word_json:
+            paths['json'] = f"{base_path}.words.json"
+        return cls(paths)
+
+    @property
+    def created_files(self):
+        return [str(path) for path in self.paths.values()]
+
+    def write(self, segment):
+        """Write one Whisper segment to every open format."""
+        files = self._files
+        # Strip once and share between TXT and JSON
+        text = segment.text.strip()
+        if 'txt' in files:
+            files['txt'].write(text + "\n")
+        if 'json' in files:
+            self._write_word_json(segment, text)
+        self.segment_count += 1
+
+        if not any(fmt in files for fmt in ('vtt', 'srt', 'csv', 'tsv')):
+            return
+        vtt, srt = files.get('vtt'), files.get('srt')
+        block = FormatHandler._cue_block
+        for cue in FormatHandler.resegment_for_subtitles([segment]):
+            self.cue_count += 1
+            cue_text = cue.text  # resegment_for_subtitles already strips cue text
+            # Format each timestamp once; VTT, CSV and TSV share it and SRT
+            # only differs in the millisecond separator
+            start = FormatHandler.format_vtt_time(cue.start)
+            end = FormatHandler.format_vtt_time(cue.end)
+            if vtt:
+                vtt.write(block(self.cue_count, start, end, cue_text))
+            if srt:
+                srt.write(block(self.cue_count, start.replace('.', ','), end.replace('.', ','), cue_text))
+            for writer in self._csv_writers.values():
+                writer.writerow((start, end, cue_text))
+
+    def _write_word_json(self, segment, text):
+        seg_dict = {
+            "start": segment.start,
+            "end": segment.end,
+            "text": text,
+            "words": []
+        }
+        if hasattr(segment, 'words') and segment.words:
+            for w in segment.words:
+                seg_dict["words"].append({
+                    "start": w.start,
+                    "end": w.end,
+                    "word": w.word,
+                    "probability": w.probability
+                })
+        # Stream array items with the same layout json.dump(..., indent=4) produces
+        item = json.dumps(seg_dict, indent=4, ensure_ascii=False).replace("\n", "\n    ")
+        self._files['json'].write(("\n    " if self.segment_count == 0 else ",\n    ") + item)
+
+    def close(self):
+        """Finish every file and move it over the real output path."""
+        if 'json' in self._files and not self._files['json'].closed:
+            self._files['json'].write("\n]" if self.segment_count else "]")
+        try:
+            for fmt in list(self._files):
+                self._files[fmt].close()
+                os.replace(self._parts[fmt], self.paths[fmt])
+                del self._files[fmt]
+        finally:
+            # Anything not yet moved into place (e.g. a locked target on Windows)
+            self.discard()
+
+    def discard(self):
+        """Close and delete the .part files this writer created; real outputs are untouched."""
+        for fmt, f in self._files.items():
+            f.close()
+            self._parts[fmt].unlink(missing_ok=True)
+        self._files.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
 class CallbackStream:
     """Redirects writes to a callback function."""
     def __init__(self, callback):
@@ -793,13 +1237,20 @@ class Summarizer:
             return f"Cloud LLM Error: {e}"
 
 class TextifierCore:
-    def __init__(self, load_translation_model=False, whisper_model_name="large-v3-turbo", status_callback=None):
+    def __init__(self, load_translation_model=False, whisper_model_name="large-v3-turbo", status_callback=None,
+                 translation_8bit=False, cpu_threads=None):
         self.status_callback = status_callback
         logging.info("Initializing TextifierCore")
         
+        # Cap CPU inference threads before torch/CTranslate2 are imported so
+        # Whisper, mBART and OpenMP don't each spin up one thread per core
+        self.cpu_threads = cpu_threads or _default_cpu_threads()
+        os.environ.setdefault("OMP_NUM_THREADS", str(self.cpu_threads))
+        
         self.model_manager = ModelManager(status_callback=status_callback)
-        self.transcriber = Transcriber(self.model_manager, status_callback=status_callback)
-        self.translator = Translator(self.model_manager, status_callback=status_callback)
+        self.transcriber = Transcriber(self.model_manager, status_callback=status_callback, cpu_threads=self.cpu_threads)
+        self.translator = Translator(self.model_manager, status_callback=status_callback, load_in_8bit=translation_8bit,
+                                     cpu_threads=self.cpu_threads)
         self.format_handler = FormatHandler()
         self.summarizer = Summarizer(status_callback) # Added summarizer
         
@@ -883,8 +1334,7 @@ class TextifierCore:
         # EXTRACT AUDIO IF NEEDED
         # If the user provides a video file to the Transcribe/Batch tab, explicitly
         # save the .mp3 first before handing it to Whisper.
-        audio_only_exts = {'.mp3', '.wav', '.m4a', '.aac', '.flac', '.ogg'}
-        if input_path.suffix.lower() not in audio_only_exts:
+        if input_path.suffix.lower() not in _AUDIO_ONLY_EXTS:
             extracted_path = self.extract_audio(str(input_path), output_dir)
             if extracted_path:
                 input_path = Path(extracted_path)
@@ -916,78 +1366,32 @@ class TextifierCore:
         formats = output_formats
         self._update_status(f"Writing formats: {', '.join(formats)}...")
         
-        # Re-segment into short subtitle cues (2-4s) for timed output formats.
-        # This ensures subtitles display properly in video players without
-        # overflowing the screen with too much text at once.
-        subtitle_segments = self.format_handler.resegment_for_subtitles(segments)
-        self._update_status(f"Re-segmented {len(segments)} chunks into {len(subtitle_segments)} subtitle cues.")
+        # Each segment is written as soon as Whisper yields it, so disk I/O
+        # overlaps with decoding of the next chunk. Timed formats are
+        # re-segmented into short subtitle cues (2-4s) so they display properly
+        # in video players; TXT keeps full paragraphs since it has no timecodes.
+        parent = Path(output_dir) if output_dir else input_path.parent
+        writer = TranscriptWriter.for_base_path(parent / input_path.stem, formats, word_json=user_requested_word_timestamps)
+        with writer:
+            for segment in segments:
+                writer.write(segment)
+            if self.transcriber.stop_requested:
+                writer.discard()
+                return None
         
-        base_output_path = (Path(output_dir) if output_dir else input_path.parent) / input_path.stem
-        created_files = []
-
-        # Save VTT (uses short subtitle cues)
-        if 'vtt' in formats:
-            vtt_path = base_output_path.with_suffix(".vtt")
-            self.format_handler.save_vtt(subtitle_segments, vtt_path)
-            created_files.append(str(vtt_path))
-
-        # Save SRT (uses short subtitle cues)
-        if 'srt' in formats:
-            srt_path = base_output_path.with_suffix(".srt")
-            self.format_handler.save_srt(subtitle_segments, srt_path)
-            created_files.append(str(srt_path))
-
-        # Save TXT (uses original segments — no timecodes, so full paragraphs are fine)
-        if 'txt' in formats:
-            txt_path = base_output_path.with_suffix(".txt")
-            self.format_handler.save_txt(segments, txt_path)
-            created_files.append(str(txt_path))
-
-        # Save CSV (uses short subtitle cues)
-        if 'csv' in formats:
-            csv_path = base_output_path.with_suffix(".csv")
-            self.format_handler.save_csv(subtitle_segments, csv_path)
-            created_files.append(str(csv_path))
-
-        # Save TSV (uses short subtitle cues)
-        if 'tsv' in formats:
-            tsv_path = base_output_path.with_suffix(".tsv")
-            self.format_handler.save_tsv(subtitle_segments, tsv_path)
-            created_files.append(str(tsv_path))
-
-        # Save Word-Level JSON (uses original segments for full detail)
-        if user_requested_word_timestamps:
-            json_path = base_output_path.with_suffix(".words.json")
-            word_data = []
-            for s in segments:
-                seg_dict = {
-                    "start": s.start,
-                    "end": s.end,
-                    "text": s.text.strip(),
-                    "words": []
-                }
-                if hasattr(s, 'words') and s.words:
-                    for w in s.words:
-                        seg_dict["words"].append({
-                            "start": w.start,
-                            "end": w.end,
-                            "word": w.word,
-                            "probability": w.probability
-                        })
-                word_data.append(seg_dict)
-            
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(word_data, f, indent=4, ensure_ascii=False)
-            created_files.append(str(json_path))
-            
-        return created_files
+        self._update_status(f"Re-segmented {writer.segment_count} chunks into {writer.cue_count} subtitle cues.")
+        return writer.created_files
 
     def translate_vtt(self, input_path, source_lang="en", target_lang="fr", output_dir=None):
         """Legacy method for VTT translation. Calls translate_file() internally."""
         return self.translate_file(input_path, source_lang, target_lang, output_dir)
     
-    def translate_file(self, input_path, source_lang="en", target_lang="fr", output_dir=None):
-        """Translate any supported file format (VTT, SRT, TXT, CSV) to target language."""
+    def translate_file(self, input_path, source_lang="en", target_lang="fr", output_dir=None,
+                       num_beams=_TRANSLATION_NUM_BEAMS):
+        """Translate any supported file format (VTT, SRT, TXT, CSV) to target language.
+
+        num_beams > 1 enables beam search (slower, occasionally more fluent).
+        """
         input_path = self._normalize_path(input_path)
         
         # Detect format from extension
@@ -1008,19 +1412,19 @@ class TextifierCore:
         else:
             raise ValueError(f"Unsupported file format: {ext}. Supported: .vtt, .srt, .txt, .csv, .md")
         
-        # Translate content
+        # Translate content in batches so mBART runs one generate() per group
+        noun = 'segments' if data_type == 'segments' else 'lines'
+        self._update_status(f"Translating {len(data)} {noun} from {source_lang} to {target_lang}...")
+        texts = [segment['text'] for segment in data] if data_type == 'segments' else data
+        translated = self.translator.translate_batch(
+            texts, source_lang=source_lang, target_lang=target_lang, num_beams=num_beams,
+            progress_callback=lambda done, total: self._update_status(f"Translating... {done}/{total}")
+        )
         if data_type == 'segments':
-            self._update_status(f"Translating {len(data)} segments from {source_lang} to {target_lang}...")
-            for i, segment in enumerate(data):
-                if i % 10 == 0:
-                    self._update_status(f"Translating... {i}/{len(data)}")
-                segment['text'] = self.translator.translate(segment['text'], source_lang=source_lang, target_lang=target_lang)
-        else:  # lines
-            self._update_status(f"Translating {len(data)} lines from {source_lang} to {target_lang}...")
-            for i in range(len(data)):
-                if i % 10 == 0:
-                    self._update_status(f"Translating... {i}/{len(data)}")
-                data[i] = self.translator.translate(data[i], source_lang=source_lang, target_lang=target_lang)
+            for segment, text in zip(data, translated):
+                segment['text'] = text
+        else:
+            data = translated
         
         # Save translated content in same format
         out_suffix = f"_{target_lang}{ext}"
@@ -1039,9 +1443,10 @@ class TextifierCore:
         return str(output_path)
 
     def _normalize_path(self, path_str):
-        p = Path(str(path_str).strip('"\''))
-        if not p.exists(): raise FileNotFoundError(f"Not found: {p}")
-        return p
+        # Validate on the plain string; only build a Path for paths that exist
+        p = str(path_str).strip('"\'')
+        if not os.path.exists(p): raise FileNotFoundError(f"Not found: {p}")
+        return Path(p)
 
     def parse_vtt(self, path): return self.format_handler.parse_vtt(path)
     def save_vtt_from_data(self, data, path): self.format_handler.save_vtt_from_data(data, path)
@@ -28,83 +28,136 @@ Examples:
 
 import re
 import argparse
+import bisect
+import codecs
+import html
 import sys
 from pathlib import Path
 
+# VTT timestamp line: 00:00:00.000 --> 00:00:05.000
+_TIME_RE = re.compile(r'(\d{2}:\d{2}:\d{2}\.\d{3})\s-->\s(\d{2}:\d{2}:\d{2}\.\d{3})')
+# HTML-like cue tags (e.g. <b>, <i>, <c.color>)
+_TAG_RE = re.compile(r'<[^>]+>')
+# Whitespace following sentence-ending punctuation
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Rule printed after each tutorial chunk
+_SEPARATOR = "-" * 40
+
+def _detect_encoding(filepath, sample_size=4096):
+    """Picks a text encoding from the file's BOM and a small leading sample."""
+    with open(filepath, 'rb') as f:
+        head = f.read(sample_size)
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    try:
+        # Incremental decode tolerates a multi-byte character cut off at the sample end
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+    except UnicodeDecodeError:
+        return 'latin-1'
+    return 'utf-8'
+
+def _split_sentences(text):
+    """Split text after '.', '!' or '?' followed by whitespace."""
+    return _SENT_SPLIT_RE.split(text)
+
 class VTTProcessor:
     def __init__(self, filepath):
         self.filepath = Path(filepath)
-        self.blocks = []  # Will store dicts: {'start': str, 'end': str, 'text': str}
+        # Parallel per-block columns (index i is one cue)
+        self.block_starts = []
+        self.block_ends = []
+        self.block_texts = []
         self.full_text = ""
+        self._block_offsets = []  # Where each block's text starts inside full_text
+        self._sentences = None  # Sentence split of full_text, built on first use
         
     def parse(self):
         """
         Parses the VTT file into structured blocks and a full text stream.
         """
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            self._parse_file(_detect_encoding(self.filepath))
         except FileNotFoundError:
             print(f"Error: File not found: {self.filepath}")
             sys.exit(1)
         except UnicodeDecodeError:
-             # Fallback for other encodings if utf-8 fails
-            with open(self.filepath, 'r', encoding='latin-1') as f:
-                content = f.read()
+            # Sample looked like utf-8 but a later byte was not: reparse as latin-1
+            self._parse_file('latin-1')
 
-        # Split content into blocks based on double newlines or VTT format specifics
-        lines = content.splitlines()
-        
-        # Regex for VTT timestamp: 00:00:00.000 --> 00:00:05.000
-        time_pattern = re.compile(r'(\d{2}:\d{2}:\d{2}\.\d{3})\s-->\s(\d{2}:\d{2}:\d{2}\.\d{3})')
-        
-        current_block = {'text': []}
-        
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
-                continue
-            
-            if line == "WEBVTT":
-                continue
-                
-            # Check if it's a simple number (sequence ID)
-            if line.isdigit():
-                continue
-                
-            # Check if it's a timestamp
-            time_match = time_pattern.search(line)
-            if time_match:
-                # Save previous block if it has text
-                if 'start' in current_block and current_block['text']:
-                    self._add_block(current_block)
-                    current_block = {'text': []}
-                
-                current_block['start'] = time_match.group(1)
-                current_block['end'] = time_match.group(2)
-                continue
-            
-            # If we are here, it's text content
-            current_block['text'].append(line)
+        # Create a clean full text version
+        self.full_text = " ".join(self.block_texts)
+        self._block_offsets = [0] * len(self.block_texts)
+        for i in range(1, len(self.block_texts)):
+            self._block_offsets[i] = self._block_offsets[i - 1] + len(self.block_texts[i - 1]) + 1
+        self._sentences = None
+
+    def _parse_file(self, encoding):
+        """Reads the file line by line into the block lists (never holds the whole file)."""
+        self.block_starts = []
+        self.block_ends = []
+        self.block_texts = []
+        # Current cue: timing scalars plus one text buffer reused for every block
+        cur_start = cur_end = None
+        text_buf = []
+        # Bound once: the loop body then uses fast local lookups
+        time_search = _TIME_RE.search
+
+        with open(self.filepath, 'r', encoding=encoding, buffering=1 << 20) as f:
+            for line in f:
+                # One strip drops the newline and any surrounding whitespace
+                line = line.strip()
+
+                # Blank lines, the header and sequence IDs carry no content.
+                # isdigit() stops at the first non-digit, so text lines exit early.
+                if not line or line == "WEBVTT" or line.isdigit():
+                    continue
+
+                # Check if it's a timestamp. Every match contains "-->", so the
+                # substring test rejects cue text without starting the regex.
+                time_match = '-->' in line and time_search(line)
+                if time_match:
+                    # Save previous block if it has text
+                    if cur_start is not None and text_buf:
+                        self._add_block(cur_start, cur_end, text_buf)
+                        text_buf.clear()
+
+                    cur_start, cur_end = time_match.group(1, 2)
+                    continue
+
+                # If we are here, it's text content
+                text_buf.append(line)
 
         # Add the final block
-        if 'start' in current_block and current_block['text']:
-            self._add_block(current_block)
-            
-        # Create a clean full text version
-        self.full_text = " ".join([b['text'] for b in self.blocks])
+        if cur_start is not None and text_buf:
+            self._add_block(cur_start, cur_end, text_buf)
 
-    def _add_block(self, block_data):
+    def _add_block(self, start, end, text_lines):
         """Helper to finalize a block before adding to list."""
-        clean_text = " ".join(block_data['text'])
-        # Basic cleanup of HTML-like tags if present in VTT (e.g., <b>)
-        clean_text = re.sub(r'<[^>]+>', '', clean_text)
-        self.blocks.append({
-            'start': block_data.get('start'),
-            'end': block_data.get('end'),
-            'text': clean_text
-        })
+        clean_text = " ".join(text_lines)
+        # Basic cleanup of HTML-like tags if present in VTT (e.g., <b>).
+        # Most cues have none, so skip the regex unless a '<' is present.
+        if '<' in clean_text:
+            clean_text = _TAG_RE.sub('', clean_text)
+        self.block_starts.append(start)
+        self.block_ends.append(end)
+        self.block_texts.append(clean_text)
+
+    @property
+    def blocks(self):
+        """Blocks as a list of {'start', 'end', 'text'} dicts (built on demand)."""
+        return [
+            {'start': start, 'end': end, 'text': text}
+            for start, end, text in zip(self.block_starts, self.block_ends, self.block_texts)
+        ]
+
+    def _sentences_list(self):
+        """Returns full_text split into sentences, computed once per parse."""
+        if self._sentences is None:
+            self._sentences = _split_sentences(self.full_text)
+        return self._sentences
 
     def get_plain_text(self):
         """Returns the text as a single continuous string."""
@@ -114,63 +167,74 @@ class VTTProcessor:
         """
         Returns text broken into chunks with placeholders for images.
         """
+        return "\n".join(self.iter_tutorial_lines(chunk_size, include_timestamps))
+
+    def iter_tutorial_lines(self, chunk_size=3, include_timestamps=True):
+        """Yields the tutorial output line by line (see get_tutorial_format)."""
         # Split full text into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', self.full_text)
-        
-        output_lines = []
-        current_chunk = []
+        sentences = self._sentences_list()
         
-        for i, sentence in enumerate(sentences):
-            current_chunk.append(sentence)
+        # One slice per chunk; the last chunk may be shorter
+        step = max(1, chunk_size)
+        for k in range(0, len(sentences), step):
+            chunk = sentences[k:k + step]
+            yield " ".join(chunk)
+            yield "" # Empty line
             
-            is_last = (i + 1) == len(sentences)
-            is_chunk_end = (i + 1) % chunk_size == 0
+            if include_timestamps:
+                yield f"[IMAGE PLACEHOLDER - Approx Time: {self._find_time_for_text(chunk[-1])}]"
+            else:
+                yield "[IMAGE PLACEHOLDER]"
             
-            if is_chunk_end or is_last:
-                text_block = " ".join(current_chunk)
-                output_lines.append(text_block)
-                output_lines.append("") # Empty line
-                
-                if include_timestamps:
-                    output_lines.append(f"[IMAGE PLACEHOLDER - Approx Time: {self._find_time_for_text(sentence)}]")
-                else:
-                    output_lines.append("[IMAGE PLACEHOLDER]")
-                
-                output_lines.append("-" * 40)
-                output_lines.append("")
-                current_chunk = []
-                
-        return "\n".join(output_lines)
+            yield _SEPARATOR
+            yield ""
 
     def get_html_format(self, chunk_size=3):
         """Generates simple HTML markup for the tutorial."""
-        sentences = re.split(r'(?<=[.!?])\s+', self.full_text)
-        html = ["<article class='tutorial'>"]
+        return "\n".join(self.iter_html_lines(chunk_size))
+
+    def iter_html_lines(self, chunk_size=3):
+        """Yields the HTML output line by line (see get_html_format)."""
+        sentences = self._sentences_list()
+        yield "<article class='tutorial'>"
         
-        current_chunk = []
-        for i, sentence in enumerate(sentences):
-            current_chunk.append(sentence)
-            
-            if (i + 1) % chunk_size == 0 or (i + 1) == len(sentences):
-                text_block = " ".join(current_chunk)
-                html.append(f"  <p>{text_block}</p>")
-                html.append("  <!-- Insert Image Here -->")
-                html.append("  <figure class='tutorial-image'>")
-                html.append(f"    <img src='placeholder.jpg' alt='Tutorial step {(i+1)//max(1, chunk_size)}'>")
-                html.append("  </figure>")
-                current_chunk = []
+        step = max(1, chunk_size)
+        for step_no, k in enumerate(range(0, len(sentences), step), 1):
+            text_block = " ".join(sentences[k:k + step])
+            # Escape markup characters; most chunks have none and pass through as-is
+            if '&' in text_block or '<' in text_block or '>' in text_block:
+                text_block = html.escape(text_block, quote=False)
+            yield f"  <p>{text_block}</p>"
+            yield "  <!-- Insert Image Here -->"
+            yield "  <figure class='tutorial-image'>"
+            yield f"    <img src='placeholder.jpg' alt='Tutorial step {step_no}'>"
+            yield "  </figure>"
         
-        html.append("</article>")
-        return "\n".join(html)
+        yield "</article>"
 
     def _find_time_for_text(self, snippet):
         """Attempts to find the timestamp for a specific snippet of text."""
         snippet_start = snippet[:20] # Take first few chars
-        for block in self.blocks:
-            if snippet_start in block['text']:
-                return block['start']
+        # Search the joined text once (C speed) instead of every block in turn,
+        # then map the hit back to its block. A hit that straddles two blocks
+        # is not inside either, so keep looking.
+        offsets = self._block_offsets
+        pos = self.full_text.find(snippet_start)
+        while pos != -1 and offsets:
+            i = bisect.bisect_right(offsets, pos) - 1
+            if pos + len(snippet_start) <= offsets[i] + len(self.block_texts[i]):
+                return self.block_starts[i]
+            pos = self.full_text.find(snippet_start, pos + 1)
         return "N/A"
 
+def _write_lines(f, lines):
+    """Writes lines separated by newlines, byte-identical to f.write("\n".join(lines))."""
+    lines = iter(lines)
+    for first in lines:
+        f.write(first)
+        break
+    f.writelines("\n" + line for line in lines)
+
 def main():
     parser = argparse.ArgumentParser(description="Convert VTT transcripts to readable text or tutorial formats.")
     
@@ -204,21 +268,21 @@ def main():
     processor = VTTProcessor(input_path)
     processor.parse()
 
-    # 3. Generate Content
+    # 3. Generate Content (lazily, so large outputs stream to disk)
     if args.format == 'plain':
-        content = processor.get_plain_text()
+        lines = [processor.get_plain_text()]
     elif args.format == 'tutorial':
-        content = processor.get_tutorial_format(
+        lines = processor.iter_tutorial_lines(
             chunk_size=args.chunk_size, 
             include_timestamps=not args.no_timestamps
         )
     elif args.format == 'html':
-        content = processor.get_html_format(chunk_size=args.chunk_size)
+        lines = processor.iter_html_lines(chunk_size=args.chunk_size)
 
     # 4. Save
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            _write_lines(f, lines)
         print(f"Success! Processed content saved to: {output_path}")
     except IOError as e:
         print(f"Error writing to file: {e}")